@@ -1,12 +1,21 @@
 """
-Database package for user and post management.
+Database package for user, post and product management.
 
-This package provides CRUD operations for users and posts,
-along with database connection management.
+This package provides CRUD operations for users, posts and products,
+along with database connection management. Import from here rather
+than from the submodules.
 """
 
+from .aio import AsyncDatabaseManager
 from .core import DatabaseManager
 from .posts import PostCRUD
+from .product import ProductCRUD
 from .users import UserCRUD
 
-__all__ = ["DatabaseManager", "UserCRUD", "PostCRUD"]
+__all__ = [
+    "DatabaseManager",
+    "AsyncDatabaseManager",
+    "UserCRUD",
+    "PostCRUD",
+    "ProductCRUD",
+]
@@ -0,0 +1,148 @@
+"""
+Async counterpart of DatabaseManager built on aiomysql.
+
+It shares only the settings in BaseDatabaseManager, not the sync
+connection API (get_connection, borrow_connection, connection=).
+
+The CRUD classes only return what the manager's execute_query/fetch_*
+methods return, so with this manager they hand back coroutines and can
+be awaited directly from async route handlers.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import aiomysql
+
+from .core import BaseDatabaseManager
+
+log = logging.getLogger(__name__)
+
+
+class AsyncDatabaseManager(BaseDatabaseManager):
+    def __init__(self, *args, min_pool_size: int = 5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.min_pool_size = min(min_pool_size, self.pool_size)
+        self._async_pool = None  # Created on first use, see get_pool()
+        self._async_pool_lock = None  # Must be created inside the event loop
+
+    async def get_pool(self):
+        """Return the aiomysql pool, creating it on first use"""
+        if self._async_pool is None:
+            if self._async_pool_lock is None:
+                self._async_pool_lock = asyncio.Lock()
+            async with self._async_pool_lock:
+                if self._async_pool is None:
+                    # autocommit: aiomysql drops connections that come back
+                    # to the pool mid-transaction, which plain SELECTs would
+                    # otherwise leave open
+                    self._async_pool = await aiomysql.create_pool(
+                        minsize=self.min_pool_size,
+                        maxsize=self.pool_size,
+                        host=self.host,
+                        port=self.port,
+                        user=self.user,
+                        password=self.password,
+                        db=self.database,
+                        autocommit=True,
+                    )
+        return self._async_pool
+
+    async def close(self) -> None:
+        """Close every pooled connection, e.g. on application shutdown"""
+        if self._async_pool is not None:
+            self._async_pool.close()
+            await self._async_pool.wait_closed()
+            self._async_pool = None
+
+    async def execute_query(self, query: str, params: Tuple = None) -> bool:
+        """Execute a query that doesn't return data (INSERT, UPDATE, DELETE)
+
+        Like the other query helpers, raises aiomysql.Error on failure.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing query: %s, params: %s", query, params)
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+        return True
+
+    async def execute_insert(self, query: str, params: Tuple = None) -> Optional[int]:
+        """Execute an INSERT and return the new row's id"""
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing insert: %s, params: %s", query, params)
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                return cursor.lastrowid
+
+    async def execute_many(
+        self, query: str, rows: List[Tuple], batch_size: int = 1000
+    ) -> bool:
+        """Execute a query for many rows in a single transaction"""
+        if not rows:
+            return True
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            await conn.begin()
+            try:
+                async with conn.cursor() as cursor:
+                    for start in range(0, len(rows), batch_size):
+                        await cursor.executemany(
+                            query, rows[start : start + batch_size]
+                        )
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+        return True
+
+    async def fetch_one(self, query: str, params: Tuple = None) -> Optional[Dict]:
+        """Execute a query and return a single result"""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(query, params)
+                return await cursor.fetchone()
+
+    async def fetch_value(self, query: str, params: Tuple = None):
+        """Execute a query and return the first column of its first row"""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                row = await cursor.fetchone()
+                return row[0] if row else None
+
+    async def fetch_all(self, query: str, params: Tuple = None) -> List[Dict]:
+        """Execute a query and return all results"""
+        columns, rows = await self.fetch_all_rows(query, params)
+        return [dict(zip(columns, row)) for row in rows]
+
+    async def fetch_all_rows(
+        self, query: str, params: Tuple = None
+    ) -> Tuple[List[str], List[Tuple]]:
+        """Execute a query and return (column names, rows as plain tuples)"""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params)
+                columns = [column[0] for column in cursor.description or ()]
+                return columns, list(await cursor.fetchall())
+
+    async def fetch_iter(
+        self, query: str, params: Tuple = None, arraysize: int = 1000
+    ) -> AsyncIterator[List[Dict]]:
+        """Execute a query and yield the results in chunks of arraysize rows"""
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+                await cursor.execute(query, params)
+                while True:
+                    rows = await cursor.fetchmany(arraysize)
+                    if not rows:
+                        break
+                    yield rows
@@ -6,20 +6,75 @@ from their respective modules and making them available as if they
 were defined in this file.
 """
 
+import functools
 import logging
 import os
-from typing import Dict, List, Optional, Tuple
+import re
+import secrets
+import threading
+from contextlib import contextmanager, suppress
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import mysql.connector
 from dotenv import load_dotenv
-from mysql.connector import Error
+from mysql.connector import Error, pooling
 
 from .posts import PostCRUD
 from .product import ProductCRUD
+from .statements import StatementCache
 from .users import UserCRUD
 
+log = logging.getLogger(__name__)
+
+# Database names are interpolated into DDL, so only plain identifiers are allowed
+DATABASE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+CREATE_USERS_TABLE = """
+CREATE TABLE IF NOT EXISTS users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    password VARCHAR(255) NOT NULL
+)
+"""
+
+CREATE_POSTS_TABLE = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    title VARCHAR(255) NOT NULL,
+    content TEXT NOT NULL,
+    user_id INT NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(id)
+)
+"""
+
+CREATE_PRODUCTS_TABLE = """
+CREATE TABLE IF NOT EXISTS products (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    description TEXT NOT NULL,
+    price DECIMAL(10, 2) NOT NULL,
+    quantity INT NOT NULL
+)
+"""
+
+# Seed inserts, parameterized so executemany() can batch the sample rows
+SEED_USERS = (
+    "INSERT INTO users (name, email, password) VALUES (%s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE name=VALUES(name)"
+)
+SEED_PRODUCTS = (
+    "INSERT INTO products (name, description, price, quantity) VALUES (%s, %s, %s, %s)"
+)
+SEED_POSTS = "INSERT INTO posts (title, content, user_id) VALUES (%s, %s, %s)"
+
+
+class BaseDatabaseManager:
+    """Connection settings and CRUD helpers shared by the sync and async managers
+
+    Subclasses supply the query methods the CRUD classes call.
+    """
 
-class DatabaseManager:
     def __init__(
         self,
         host: str,
@@ -27,19 +82,34 @@ class DatabaseManager:
         user: str,
         password: str,
         database: str,
+        pool_size: int = 20,
+        use_pure: Optional[bool] = None,
     ):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
+        if not DATABASE_NAME_PATTERN.match(database):
+            raise ValueError(
+                "Database name may only contain letters, digits and underscores"
+            )
         self.database = database
+        self._quoted_database = f"`{database}`"
+        self.pool_size = pool_size
+        # Decode rows in the bundled C extension unless asked not to (or it
+        # isn't installed, where use_pure=False would raise ImportError)
+        self.use_pure = not mysql.connector.HAVE_CEXT if use_pure is None else use_pure
         self.users = UserCRUD(self)  # Initialize UserCRUD
         self.posts = PostCRUD(self)  # Initialize PostCRUD
         self.products = ProductCRUD(self)  # Initialize ProductCRUD
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def from_env(cls):
-        """Create a DatabaseManager instance from environment variables"""
+        """Create a DatabaseManager instance from environment variables
+
+        The instance is cached per class, so every caller shares one pool.
+        """
         load_dotenv()  # Load .env file
 
         # Get values from environment variables - no defaults
@@ -48,6 +118,8 @@ class DatabaseManager:
         user = os.getenv("DB_USER")
         password = os.getenv("DB_PASSWORD")
         database = os.getenv("DB_NAME")
+        pool_size_str = os.getenv("DB_POOL_SIZE", "20")
+        driver = os.getenv("DB_DRIVER", "auto").lower()
 
         # Validate that all required fields are provided
         if not host:
@@ -66,229 +138,336 @@ class DatabaseManager:
         except ValueError:
             raise ValueError("DB_PORT must be a valid integer") from None
 
+        try:
+            pool_size = int(pool_size_str)
+        except ValueError:
+            raise ValueError("DB_POOL_SIZE must be a valid integer") from None
+        if not 1 <= pool_size <= pooling.CNX_POOL_MAXSIZE:
+            raise ValueError(
+                f"DB_POOL_SIZE must be between 1 and {pooling.CNX_POOL_MAXSIZE}"
+            )
+
+        drivers = {"auto": None, "cext": False, "pure": True}
+        if driver not in drivers:
+            raise ValueError("DB_DRIVER must be one of: auto, cext, pure")
+
         return cls(
             host=host,
             port=port,
             user=user,
             password=password,
             database=database,
+            pool_size=pool_size,
+            use_pure=drivers[driver],
         )
 
+
+class DatabaseManager(BaseDatabaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = None  # Created on first use, see get_connection()
+        self._pool_lock = threading.Lock()
+
     def get_connection(self):
+        """Borrow a connection from the pool; close() hands it back
+
+        Raises mysql.connector.Error when no connection can be made.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = pooling.MySQLConnectionPool(
+                        pool_name="app",
+                        pool_size=self.pool_size,
+                        host=self.host,
+                        port=self.port,
+                        user=self.user,
+                        password=self.password,
+                        database=self.database,
+                        autocommit=False,
+                        pool_reset_session=False,
+                        use_pure=self.use_pure,
+                    )
+        return self._pool.get_connection()
+
+    def _release(self, connection) -> None:
+        """Return a borrowed connection to the pool"""
+        # No is_connected() probe first: it costs a ping round trip, and a
+        # dead connection is reconnected by the pool on its next checkout
         try:
-            connection = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-            )
-            logging.info(f"Connected to MySQL: {connection}")
-            return connection
-        except Error as e:
-            logging.error(f"Error connecting to MySQL: {e}")
-            return None
+            # Sessions are not reset on return (that would drop the prepared
+            # statements), so end any read transaction left open here
+            if connection.in_transaction:
+                with suppress(Error):
+                    connection.rollback()
+        finally:
+            connection.close()
 
-    def execute_query(self, query: str, params: Tuple = None) -> bool:
-        """Execute a query that doesn't return data (INSERT, UPDATE, DELETE)"""
-        logging.info(f"Executing query: {query}")
-        logging.info(f"Params: {params}")
+    @contextmanager
+    def borrow_connection(self):
+        """Hold one pooled connection across several execute_query/fetch_* calls"""
         connection = self.get_connection()
-        if not connection:
-            return False
-
         try:
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            connection.commit()
-            return True
-        except Error as e:
-            logging.error(f"Error executing query: {e}")
-            return False
+            yield connection
         finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+            self._release(connection)
 
-    def fetch_one(self, query: str, params: Tuple = None) -> Optional[Dict]:
-        """Execute a query and return a single result"""
-        connection = self.get_connection()
-        if not connection:
-            return None
+    @contextmanager
+    def _with_cursor(self, query: str, params: Tuple = None, conn=None):
+        """Execute query on a cached prepared cursor and yield (conn, cursor)
 
+        A connection is borrowed from the pool only when conn is None.
+        """
+        owns_connection = conn is None
+        if owns_connection:
+            conn = self.get_connection()
+
+        statements = StatementCache.for_connection(conn)
         try:
-            cursor = connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            result = cursor.fetchone()
-            return result
-        except Error as e:
-            logging.error(f"Error fetching data: {e}")
-            return None
+            query, cursor = statements.get(conn, query)
+            try:
+                cursor.execute(query, params or ())
+            except Error:
+                statements.discard(query)
+                raise
+            yield conn, cursor
         finally:
-            if connection.is_connected():
+            if owns_connection:
+                self._release(conn)
+
+    def execute_query(self, query: str, params: Tuple = None, connection=None) -> bool:
+        """Execute a query that doesn't return data (INSERT, UPDATE, DELETE)
+
+        Like the other query helpers, raises mysql.connector.Error on failure.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing query: %s, params: %s", query, params)
+        with self._with_cursor(query, params, conn=connection) as (conn, _):
+            # Skip the COMMIT round trip when autocommit already ended it
+            if conn.in_transaction:
+                conn.commit()
+            return True
+
+    def execute_insert(
+        self, query: str, params: Tuple = None, connection=None
+    ) -> Optional[int]:
+        """Execute an INSERT and return the new row's id
+
+        The id arrives with the INSERT's own response, so callers can build
+        the created row without reading it back.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Executing insert: %s, params: %s", query, params)
+        with self._with_cursor(query, params, conn=connection) as (conn, cursor):
+            if conn.in_transaction:
+                conn.commit()
+            return cursor.lastrowid
+
+    def execute_many(
+        self,
+        query: str,
+        rows: List[Tuple],
+        batch_size: int = 1000,
+        connection=None,
+    ) -> bool:
+        """Execute a query for many rows in a single transaction
+
+        Rows are sent batch_size at a time; for INSERT ... VALUES the driver
+        folds each batch into one multi-row statement. Nothing is committed
+        if any batch fails.
+        """
+        if not rows:
+            return True
+        owns_connection = connection is None
+        conn = self.get_connection() if owns_connection else connection
+        try:
+            # A plain cursor: prepared cursors run executemany row by row
+            cursor = conn.cursor()
+            try:
+                for start in range(0, len(rows), batch_size):
+                    cursor.executemany(query, rows[start : start + batch_size])
+            finally:
                 cursor.close()
-                connection.close()
+            conn.commit()
+            return True
+        except Error:
+            with suppress(Error):
+                conn.rollback()
+            raise
+        finally:
+            if owns_connection:
+                self._release(conn)
 
-    def fetch_all(self, query: str, params: Tuple = None) -> List[Dict]:
+    def fetch_one(
+        self, query: str, params: Tuple = None, connection=None
+    ) -> Optional[Dict]:
+        """Execute a query and return a single result"""
+        with self._with_cursor(query, params, conn=connection) as (_, cursor):
+            # Prepared cursors are unbuffered, so read every row to leave
+            # the connection clean for the next statement
+            rows = cursor.fetchall()
+            if not rows:
+                return None
+            return dict(zip(cursor.column_names, rows[0]))
+
+    def fetch_value(self, query: str, params: Tuple = None, connection=None):
+        """Execute a query and return the first column of its first row"""
+        with self._with_cursor(query, params, conn=connection) as (_, cursor):
+            rows = cursor.fetchall()
+            return rows[0][0] if rows else None
+
+    def fetch_all(
+        self, query: str, params: Tuple = None, connection=None
+    ) -> List[Dict]:
         """Execute a query and return all results"""
+        columns, rows = self.fetch_all_rows(query, params, connection=connection)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def fetch_all_rows(
+        self, query: str, params: Tuple = None, connection=None
+    ) -> Tuple[List[str], List[Tuple]]:
+        """Execute a query and return (column names, rows as plain tuples)
+
+        Skips building a dict per row, for callers that don't index by name.
+        """
+        with self._with_cursor(query, params, conn=connection) as (_, cursor):
+            return list(cursor.column_names), cursor.fetchall()
+
+    def fetch_iter(
+        self, query: str, params: Tuple = None, arraysize: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """Execute a query and yield the results in chunks of arraysize rows
+
+        Uses an unbuffered cursor, so the full result is never held in memory.
+        """
         connection = self.get_connection()
-        if not connection:
-            return []
-
+        cursor = None
         try:
-            cursor = connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            result = cursor.fetchall()
-            return result
-        except Error as e:
-            logging.error(f"Error fetching data: {e}")
-            return []
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(arraysize)
+                if not rows:
+                    break
+                yield rows
         finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+            try:
+                # A caller that stops early leaves rows unread, and close()
+                # raises "Unread result found" unless they are drained first
+                with suppress(Error):
+                    connection.consume_results()
+                if cursor is not None:
+                    with suppress(Error):
+                        cursor.close()
+            finally:
+                self._release(connection)
 
     # Database initialization
-    def initialize_database(self):
-        """Create the database and tables if they don't exist"""
+    def initialize_database(self, connection=None):
+        """Create the database and tables if they don't exist
+
+        Pass connection to reuse an open server connection (as clean_db does)
+        instead of opening a new one.
+        """
+        owns_connection = connection is None
         try:
-            # Connect without specifying database
-            connection = mysql.connector.connect(
-                host=self.host, port=self.port, user=self.user, password=self.password
-            )
+            if owns_connection:
+                # Connect without specifying database
+                connection = mysql.connector.connect(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    use_pure=self.use_pure,
+                )
 
-            if connection.is_connected():
-                cursor = connection.cursor()
+            cursor = connection.cursor()
 
-                # Create database if it doesn't exist
-                cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.database}")
-                cursor.execute(f"USE {self.database}")
+            # Create database if it doesn't exist
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self._quoted_database}")
+            cursor.execute(f"USE {self._quoted_database}")
+
+            users_rows = [
+                (name, email, secrets.token_hex(8))
+                for name, email in [
+                    ("John Doe", "john.doe@example.com"),
+                    ("Jane Smith", "jane.smith@example.com"),
+                    ("Bob Johnson", "bob.johnson@example.com"),
+                    ("Alice Brown", "alice.brown@example.com"),
+                    ("Charlie Wilson", "charlie.wilson@example.com"),
+                ]
+            ]
+            products_rows = [
+                ("MacBook Pro 16 inch", "Apple MacBook Pro with M3 chip, 16GB RAM, 512GB SSD", 2499.00, 25),
+                ("Dell XPS 13", "Ultra-portable laptop with Intel i7, 16GB RAM, 1TB SSD", 1299.00, 40),
+                ("iPhone 15 Pro", "Latest iPhone with A17 Pro chip, 128GB storage, Titanium design", 999.00, 75),
+                ("Samsung Galaxy S24", "Android flagship with 256GB storage and advanced camera system", 899.00, 60),
+                ("Sony WH-1000XM5", "Premium noise-canceling wireless headphones", 399.00, 120),
+            ]  # fmt: skip
+            posts_rows = [
+                ("My Journey with FastAPI", "John shares his experience building scalable APIs with FastAPI and the lessons learned along the way", 1),
+                ("Designing User-Centric Databases", "Jane discusses her approach to creating database schemas that prioritize user experience and performance", 1),
+                ("Advanced Python Patterns I Use Daily", "Bob reveals the Python techniques and patterns that have transformed his development workflow", 3),
+                ("Building Modern Web Apps: My Story", "Alice walks through her process of creating full-stack applications using cutting-edge technologies", 4),
+                ("How I Secure My APIs", "Charlie explains his comprehensive approach to API security and the tools he relies on", 1),
+            ]  # fmt: skip
+
+            cursor.execute(CREATE_USERS_TABLE)
+            cursor.execute(CREATE_POSTS_TABLE)
+            cursor.execute(CREATE_PRODUCTS_TABLE)
+            # executemany() rewrites each INSERT into a single multi-row
+            # VALUES statement, so every table is seeded in one round trip
+            cursor.executemany(SEED_USERS, users_rows)
+            cursor.executemany(SEED_PRODUCTS, products_rows)
+            cursor.executemany(SEED_POSTS, posts_rows)
+            # The seed rows of all three tables go in with this one commit
+            connection.commit()
 
-                # Create users table
-                create_users_table = """
-                CREATE TABLE IF NOT EXISTS users (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    email VARCHAR(255) NOT NULL UNIQUE,
-                    password VARCHAR(255) NOT NULL
-                )
-                """
-
-                create_posts_table = """
-                CREATE TABLE IF NOT EXISTS posts (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    title VARCHAR(255) NOT NULL,
-                    content TEXT NOT NULL,
-                    user_id INT NOT NULL,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-                """
-
-                create_products_table = """
-                CREATE TABLE IF NOT EXISTS products (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    description TEXT NOT NULL,
-                    price DECIMAL(10, 2) NOT NULL,
-                    quantity INT NOT NULL
-                )
-                """
-
-                load_posts_db_data = """
-                INSERT INTO posts (title, content, user_id) VALUES
-                    ('My Journey with FastAPI', 'John shares his experience building scalable APIs with FastAPI and the lessons learned along the way', 1),
-                    ('Designing User-Centric Databases', 'Jane discusses her approach to creating database schemas that prioritize user experience and performance', 2),
-                    ('Advanced Python Patterns I Use Daily', 'Bob reveals the Python techniques and patterns that have transformed his development workflow', 3),
-                    ('Building Modern Web Apps: My Story', 'Alice walks through her process of creating full-stack applications using cutting-edge technologies', 4),
-                    ('How I Secure My APIs', 'Charlie explains his comprehensive approach to API security and the tools he relies on', 1),
-                """
-
-                load_users_db_data = """
-                INSERT INTO users (name, email, password) VALUES
-                    ('John Doe', 'john.doe@example.com', 
-                     CONCAT(SUBSTRING(MD5(RAND()), 1, 8), 
-                            SUBSTRING(MD5(RAND()), 1, 8))),
-                    ('Jane Smith', 'jane.smith@example.com', 
-                     CONCAT(SUBSTRING(MD5(RAND()), 1, 8), 
-                            SUBSTRING(MD5(RAND()), 1, 8))),
-                    ('Bob Johnson', 'bob.johnson@example.com', 
-                     CONCAT(SUBSTRING(MD5(RAND()), 1, 8), 
-                            SUBSTRING(MD5(RAND()), 1, 8))),
-                    ('Alice Brown', 'alice.brown@example.com', 
-                     CONCAT(SUBSTRING(MD5(RAND()), 1, 8), 
-                            SUBSTRING(MD5(RAND()), 1, 8))),
-                    ('Charlie Wilson', 'charlie.wilson@example.com', 
-                     CONCAT(SUBSTRING(MD5(RAND()), 1, 8), 
-                            SUBSTRING(MD5(RAND()), 1, 8)))
-                ON DUPLICATE KEY UPDATE name=VALUES(name);
-                """
-                load_products_db_data = """
-                INSERT INTO products (name, description, price, quantity) VALUES
-                    ('MacBook Pro 16 inch', 'Apple MacBook Pro with M3 chip, 16GB RAM, 512GB SSD', 2499.00, 25),
-                    ('Dell XPS 13', 'Ultra-portable laptop with Intel i7, 16GB RAM, 1TB SSD', 1299.00, 40),
-                    ('iPhone 15 Pro', 'Latest iPhone with A17 Pro chip, 128GB storage, Titanium design', 999.00, 75),
-                    ('Samsung Galaxy S24', 'Android flagship with 256GB storage and advanced camera system', 899.00, 60),
-                    ('Sony WH-1000XM5', 'Premium noise-canceling wireless headphones', 399.00, 120)
-                """
-                load_posts_db_data = """
-                INSERT INTO posts (title, content, user_id) VALUES
-                    ('My Journey with FastAPI', 'John shares his experience building scalable APIs with FastAPI and the lessons learned along the way', 1),
-                    ('Designing User-Centric Databases', 'Jane discusses her approach to creating database schemas that prioritize user experience and performance', 1),
-                    ('Advanced Python Patterns I Use Daily', 'Bob reveals the Python techniques and patterns that have transformed his development workflow', 3),
-                    ('Building Modern Web Apps: My Story', 'Alice walks through her process of creating full-stack applications using cutting-edge technologies', 4),
-                    ('How I Secure My APIs', 'Charlie explains his comprehensive approach to API security and the tools he relies on', 1)
-                """
-                cursor.execute(create_users_table)
-                cursor.execute(create_posts_table)
-                cursor.execute(create_products_table)
-                cursor.execute(load_users_db_data)
-                cursor.execute(load_products_db_data)
-                cursor.execute(load_posts_db_data)
-                connection.commit()  # Commit the transaction to save the data
-
-                logging.info("Database initialized successfully")
-                return True
+            log.info("Database initialized successfully")
+            return True
         except Error as e:
-            logging.error(f"Error initializing database: {e}")
+            log.error("Error initializing database: %s", e)
+            if connection is not None:
+                with suppress(Error):
+                    connection.rollback()
             return False
         finally:
-            if "connection" in locals() and connection.is_connected():
-                cursor.close()
-                connection.close()
+            if "cursor" in locals():
+                with suppress(Error):
+                    cursor.close()
+            if owns_connection and connection is not None:
+                with suppress(Error):
+                    connection.close()
 
     def clean_db(self):
         """Clean the database and initialize it again"""
         try:
             # Connect without specifying database
             connection = mysql.connector.connect(
-                host=self.host, port=self.port, user=self.user, password=self.password
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                use_pure=self.use_pure,
             )
 
-            if connection.is_connected():
-                cursor = connection.cursor()
-                cursor.execute(f"DROP DATABASE IF EXISTS {self.database}")
-                connection.commit()
-                logging.info(f"Database: {self.database} dropped")
+            cursor = connection.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS {self._quoted_database}")
+            log.info("Database: %s dropped", self.database)
 
-                # Now reinitialize
-                initialize_success = self.initialize_database()
-                return initialize_success
+            # Now reinitialize, on the same connection
+            initialize_success = self.initialize_database(connection)
+            return initialize_success
         except Error as e:
-            logging.error(f"Error cleaning database: {e}")
+            log.error("Error cleaning database: %s", e)
             return False
         finally:
-            if "connection" in locals() and connection.is_connected():
-                cursor.close()
-                connection.close()
+            if "cursor" in locals():
+                with suppress(Error):
+                    cursor.close()
+            if "connection" in locals():
+                with suppress(Error):
+                    connection.close()
 
 
 # Re-export for backward compatibility
@@ -1,5 +1,7 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
 
 
 class PostCRUD:
@@ -9,23 +11,44 @@ class PostCRUD:
     def get_all_posts(self) -> List[Dict]:
         """Get all posts from the database"""
         query = "SELECT * FROM posts"
-        logging.info("Getting all posts")
+        log.debug("Getting all posts")
+        return self.db_manager.fetch_all(query)
+
+    def iter_all_posts(self):
+        """Stream all posts from the database in chunks of rows"""
+        query = "SELECT * FROM posts"
+        log.debug("Streaming all posts")
+        return self.db_manager.fetch_iter(query)
+
+    def get_posts_with_authors(self) -> List[Dict]:
+        """Get all posts along with their author's name and email"""
+        query = (
+            "SELECT p.*, u.name AS author_name, u.email AS author_email "
+            "FROM posts p JOIN users u ON u.id = p.user_id"
+        )
+        log.debug("Getting all posts with authors")
         return self.db_manager.fetch_all(query)
 
     def get_post_by_id(self, post_id: int) -> Optional[Dict]:
         """Get a post by its ID"""
         query = "SELECT * FROM posts WHERE id = %s"
-        logging.info(f"Getting post by ID: {post_id}")
+        log.debug("Getting post by ID: %s", post_id)
         return self.db_manager.fetch_one(query, (post_id,))
 
     def get_posts_by_user_id(self, user_id: int) -> List[Dict]:
         """Get all posts by a user's ID"""
         query = "SELECT * FROM posts WHERE user_id = %s"
-        logging.info(f"Getting posts by user ID: {user_id}")
+        log.debug("Getting posts by user ID: %s", user_id)
         return self.db_manager.fetch_all(query, (user_id,))
 
-    def create_post(self, title: str, content: str, user_id: int) -> bool:
-        """Create a new post in the database"""
+    def create_post(self, title: str, content: str, user_id: int) -> Optional[int]:
+        """Create a new post in the database and return its ID"""
+        query = "INSERT INTO posts (title, content, user_id) VALUES (%s, %s, %s)"
+        log.debug("Creating post: %s, user ID: %s", title, user_id)
+        return self.db_manager.execute_insert(query, (title, content, user_id))
+
+    def create_posts(self, rows: List[Tuple[str, str, int]]) -> bool:
+        """Create many posts from (title, content, user_id) rows in one transaction"""
         query = "INSERT INTO posts (title, content, user_id) VALUES (%s, %s, %s)"
-        logging.info(f"Creating post: {title}, {content}, {user_id}")
-        return self.db_manager.execute_query(query, (title, content, user_id))
+        log.debug("Creating %d posts", len(rows))
+        return self.db_manager.execute_many(query, rows)
@@ -1,6 +1,8 @@
 import logging
 from typing import Dict, List, Optional
 
+log = logging.getLogger(__name__)
+
 
 class ProductCRUD:
     def __init__(self, db_manager):
@@ -8,12 +10,21 @@ class ProductCRUD:
 
     def get_all_products(self) -> List[Dict]:
         query = "SELECT * FROM products"
-        logging.info("Getting all products")
+        log.debug("Getting all products")
         return self.db_manager.fetch_all(query)
 
+    def count(self) -> Optional[int]:
+        log.debug("Counting products")
+        return self.db_manager.fetch_value("SELECT COUNT(*) FROM products")
+
+    def get_preview(self, n: int) -> List[Dict]:
+        query = "SELECT name, description FROM products LIMIT %s"
+        log.debug("Getting preview of %s products", n)
+        return self.db_manager.fetch_all(query, (n,))
+
     def get_product(self, product_id: int) -> Optional[Dict]:
         query = "SELECT * FROM products WHERE id = %s"
-        logging.info(f"Getting product by ID: {product_id}")
+        log.debug("Getting product by ID: %s", product_id)
         return self.db_manager.fetch_one(query, (product_id,))
 
     def create_product(
@@ -25,13 +36,13 @@ class ProductCRUD:
         is_admin: bool = False,
     ) -> bool:
         if not is_admin:
-            logging.warning(
+            log.warning(
                 "Unauthorized attempt to create product - admin access required"
             )
             raise PermissionError("Admin access required to create products")
 
         query = "INSERT INTO products (name, description, price, quantity) VALUES (%s, %s, %s, %s)"
-        logging.info(f"Creating product: {name}, {description}, {price}, {quantity}")
+        log.debug("Creating product: %s, %s, %s", name, price, quantity)
         return self.db_manager.execute_query(
             query, (name, description, price, quantity)
         )
@@ -40,14 +51,12 @@ class ProductCRUD:
         self, product_id: int, name: str, description: str, price: float, quantity: int
     ) -> bool:
         query = "UPDATE products SET name = %s, description = %s, price = %s, quantity = %s WHERE id = %s"
-        logging.info(
-            f"Updating product: {product_id}, {name}, {description}, {price}, {quantity}"
-        )
+        log.debug("Updating product: %s, %s, %s, %s", product_id, name, price, quantity)
         return self.db_manager.execute_query(
             query, (name, description, price, quantity, product_id)
         )
 
     def delete_product(self, product_id: int) -> bool:
         query = "DELETE FROM products WHERE id = %s"
-        logging.info(f"Deleting product: {product_id}")
+        log.debug("Deleting product: %s", product_id)
         return self.db_manager.execute_query(query, (product_id,))
@@ -0,0 +1,55 @@
+import sys
+from collections import OrderedDict
+from contextlib import suppress
+from typing import Optional
+
+from mysql.connector import Error
+
+
+class StatementCache:
+    """LRU of prepared cursors for one physical connection, keyed by SQL text"""
+
+    def __init__(self, maxsize: int = 128, connection_id: Optional[int] = None):
+        self.maxsize = maxsize
+        self.connection_id = connection_id  # Server session the cursors belong to
+        self._cursors = OrderedDict()
+
+    @classmethod
+    def for_connection(cls, connection) -> "StatementCache":
+        """Get the cache attached to the raw connection behind a pooled one"""
+        # Pooled connections are thin wrappers created per checkout, so the
+        # cache has to live on the underlying connection to survive reuse
+        raw = getattr(connection, "_cnx", connection)
+        cache = getattr(raw, "_statement_cache", None)
+        # The pool reconnects a dead connection on checkout, which starts a
+        # new server session without the old statement ids. Drop the stale
+        # cursors unclosed: closing them could free statements of the new one
+        if cache is None or cache.connection_id != raw.connection_id:
+            cache = cls(connection_id=raw.connection_id)
+            raw._statement_cache = cache
+        return cache
+
+    def get(self, connection, query: str):
+        """Return (query, cursor), preparing a new cursor on a cache miss"""
+        # The prepared cursor only skips re-preparing when it is handed the
+        # very same string object, so intern equal SQL texts to one object
+        query = sys.intern(query)
+        cursor = self._cursors.get(query)
+        if cursor is not None:
+            self._cursors.move_to_end(query)
+            return query, cursor
+
+        cursor = connection.cursor(prepared=True)
+        self._cursors[query] = cursor
+        if len(self._cursors) > self.maxsize:
+            _, evicted = self._cursors.popitem(last=False)
+            with suppress(Error):
+                evicted.close()
+        return query, cursor
+
+    def discard(self, query: str) -> None:
+        """Drop a cursor whose statement is no longer valid on the server"""
+        cursor = self._cursors.pop(query, None)
+        if cursor is not None:
+            with suppress(Error):
+                cursor.close()
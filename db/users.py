@@ -1,6 +1,9 @@
+import functools
 import logging
 from typing import Any, Dict, List, Optional
 
+log = logging.getLogger(__name__)
+
 
 class UserCRUD:
     def __init__(self, db_manager):
@@ -9,39 +12,81 @@ class UserCRUD:
     def create_user(self, name: str, email: str, password: str) -> bool:
         """Create a new user in the database"""
         query = "INSERT INTO users (name, email, password) VALUES (%s, %s, %s)"
-        logging.info(f"Creating user: {name}, {email}, {password}")
+        log.debug("Creating user: %s, %s", name, email)
         return self.db_manager.execute_query(query, (name, email, password))
 
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
         """Get a user by their ID"""
         query = "SELECT * FROM users WHERE id = %s"
-        logging.info(f"Getting user by ID: {user_id}")
+        log.debug("Getting user by ID: %s", user_id)
         return self.db_manager.fetch_one(query, (user_id,))
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get a user by their email"""
         query = "SELECT * FROM users WHERE email = %s"
-        logging.info(f"Getting user by email: {email}")
+        log.debug("Getting user by email: %s", email)
         return self.db_manager.fetch_one(query, (email,))
 
+    def get_users_by_ids(self, user_ids: List[int]) -> List[Dict]:
+        """Get several users by their IDs in a single query"""
+        # Even with no IDs, go through the manager so async callers always
+        # get an awaitable back
+        user_ids = tuple(dict.fromkeys(user_ids))
+        query = self._select_by_ids_sql(len(user_ids))
+        log.debug("Getting users by IDs: %s", user_ids)
+        return self.db_manager.fetch_all(query, user_ids)
+
     def get_all_users(self) -> List[Dict]:
         """Get all users from the database"""
         query = "SELECT * FROM users"
-        logging.info("Getting all users")
+        log.debug("Getting all users")
         return self.db_manager.fetch_all(query)
 
+    def count(self) -> Optional[int]:
+        """Count the users without fetching them"""
+        log.debug("Counting users")
+        return self.db_manager.fetch_value("SELECT COUNT(*) FROM users")
+
+    def get_preview(self, n: int) -> List[Dict]:
+        """Get the name and email of the first n users"""
+        query = "SELECT name, email FROM users LIMIT %s"
+        log.debug("Getting preview of %s users", n)
+        return self.db_manager.fetch_all(query, (n,))
+
+    def iter_all_users(self):
+        """Stream all users from the database in chunks of rows"""
+        query = "SELECT * FROM users"
+        log.debug("Streaming all users")
+        return self.db_manager.fetch_iter(query)
+
     def update_user(self, user_id: int, data: Dict[str, Any]) -> bool:
         """Update a user's information"""
-        set_clause = ", ".join([f"{key} = %s" for key in data.keys()])
-        values = list(data.values())
+        columns = tuple(sorted(data))
+        values = [data[column] for column in columns]
         values.append(user_id)
 
-        query = f"UPDATE users SET {set_clause} WHERE id = %s"
-        logging.info(f"Updating user: {user_id}, {data}")
+        query = self._update_sql(columns)
+        log.debug("Updating user: %s, columns: %s", user_id, columns)
         return self.db_manager.execute_query(query, tuple(values))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _update_sql(columns: tuple) -> str:
+        """Build the UPDATE statement once per set of columns"""
+        set_clause = ", ".join(f"{column} = %s" for column in columns)
+        return f"UPDATE users SET {set_clause} WHERE id = %s"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _select_by_ids_sql(count: int) -> str:
+        """Build the IN (...) lookup once per number of IDs"""
+        if not count:
+            return "SELECT * FROM users WHERE FALSE"  # IN () is a syntax error
+        placeholders = ", ".join(["%s"] * count)
+        return f"SELECT * FROM users WHERE id IN ({placeholders})"
+
     def delete_user(self, user_id: int) -> bool:
         """Delete a user from the database"""
         query = "DELETE FROM users WHERE id = %s"
-        logging.info(f"Deleting user: {user_id}")
+        log.debug("Deleting user: %s", user_id)
         return self.db_manager.execute_query(query, (user_id,))
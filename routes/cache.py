@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """In-process LRU of recent lookups, each entry kept for ttl seconds
+
+    Only touched from the event loop thread, so it needs no locking. Every
+    worker process has its own copy, so a write made through one worker can
+    take up to ttl seconds to show up in the others.
+
+    A read that awaits the database can finish after a write has popped its
+    key. Take generation(key) before the await and pass it to set(), which
+    then drops the value if the key was popped or cleared in between.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._clears = 0  # Bumped by clear(), which invalidates every key
+        self._generations = {}  # Times each key was popped since clear()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def generation(self, key: Hashable) -> Tuple[int, int]:
+        """Token for set(), changed by every pop(key) and clear()"""
+        return self._clears, self._generations.get(key, 0)
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """Cache value, unless key was invalidated since generation was taken"""
+        if generation is not None and generation != self.generation(key):
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._clears += 1
+        self._generations.clear()  # Covered by the bumped _clears
@@ -0,0 +1,13 @@
+from fastapi import Depends, Request
+from typing_extensions import Annotated
+
+from db import AsyncDatabaseManager
+
+
+def get_db(request: Request) -> AsyncDatabaseManager:
+    """Shared AsyncDatabaseManager created once at startup in src/server.py"""
+    return request.app.state.db
+
+
+# Handler parameter type that injects the shared manager, e.g. `db: Database`
+Database = Annotated[AsyncDatabaseManager, Depends(get_db)]
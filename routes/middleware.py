@@ -0,0 +1,77 @@
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+
+log = logging.getLogger(__name__)
+
+# ID of the request being handled, for log records emitted while serving it
+request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each record with the ID of the request being served
+
+    Install it on a handler that runs in the request's context (such as the
+    server's QueueHandler), not on one fed from another thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id.get()
+        return True
+
+
+class AccessLogMiddleware:
+    """Pure ASGI middleware tagging each HTTP request with an ID and writing
+    one access log record for it
+
+    Unlike BaseHTTPMiddleware it runs in the request's own task and leaves
+    the body untouched. The ID is set for every request, so RequestIdFilter
+    can stamp warnings and errors; timing and the access record are skipped
+    when INFO is disabled.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_id.set(uuid.uuid4().hex)
+        try:
+            if log.isEnabledFor(logging.INFO):
+                await self._call_logged(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+        finally:
+            request_id.reset(token)
+
+    async def _call_logged(self, scope, receive, send):
+        status = 500  # Reported if the app fails before starting a response
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            log.info(
+                "%s %s %d %.1fms",
+                scope["method"],
+                scope["path"],
+                status,
+                elapsed_ms,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status,
+                    "duration_ms": elapsed_ms,
+                },
+            )
@@ -1,66 +1,81 @@
-import logging
-from datetime import datetime
+from typing import List
 
+import orjson
 from fastapi import APIRouter
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
 
-from db.core import DatabaseManager
+from routes.dependencies import Database
+from routes.responses import ORJSONResponse
+from routes.schemas import Post
 
-router = APIRouter(prefix="/posts", tags=["posts"])
+router = APIRouter(
+    prefix="/posts", tags=["posts"], default_response_class=ORJSONResponse
+)
 
-db = DatabaseManager.from_env()
 
+@router.get("/")
+async def list_posts(db: Database):
+    posts = await db.posts.get_posts_with_authors()
+    return {"posts": posts}
 
-class Post(BaseModel):
-    post_id: int = Field(gt=0)
-    title: str = Field(min_length=3, max_length=255)
-    content: str = Field(min_length=3, max_length=255)
-    user_id: int = Field(gt=0)
-    created_at: datetime = Field(default_factory=datetime.now, alias="createdAt")
-    updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
 
+@router.get("/stream")
+async def stream_posts(db: Database):
+    """All posts as {"posts": [...]}, sent chunk by chunk as rows are read"""
 
-@router.get("/")
-def list_posts():
-    posts = db.posts.get_all_posts()
-    logging.info(f"Posts Size: {len(posts)}")
-    for post in posts:
-        logging.info(f"Post: {post}")
-    return {"posts": posts}
+    async def body():
+        separator = b""
+        yield b'{"posts":['
+        async for rows in db.posts.iter_all_posts():
+            yield separator + b",".join(orjson.dumps(row) for row in rows)
+            separator = b","
+        yield b"]}"
+
+    return StreamingResponse(body(), media_type="application/json")
 
 
 @router.get("/{post_id}")
-def get_post(post_id: int):
-    post = db.posts.get_post_by_id(post_id)
-    logging.info(f"Getting post by ID: {post_id}")
+async def get_post(post_id: int, db: Database):
+    post = await db.posts.get_post_by_id(post_id)
     return {"post": post}
 
 
 @router.post("/")
-def create_post(post: Post):
-    logging.info(f"Creating post: {post.title}, {post.content}, {post.user_id}")
-    db.posts.create_post(post.title, post.content, post.user_id)
-    return {"message": "Post created"}
+async def create_post(post: Post, db: Database):
+    # Database errors propagate from the insert, so it always yields an id
+    post_id = await db.posts.create_post(post.title, post.content, post.user_id)
+    # Built from the request and the INSERT's id, without reading the row back
+    created = {
+        "id": post_id,
+        "title": post.title,
+        "content": post.content,
+        "user_id": post.user_id,
+    }
+    return {"message": "Post created", "post": created}
+
+
+@router.post("/bulk")
+async def create_posts(posts: List[Post], db: Database):
+    # Rolled back and raised as a 500 if any row fails
+    await db.posts.create_posts(
+        [(post.title, post.content, post.user_id) for post in posts]
+    )
+    return {"message": f"{len(posts)} posts created"}
 
 
 @router.put("/{post_id}")
-def update_post(post_id: int, post: Post):
-    logging.info(
-        f"Updating post: {post_id}, {post.title}, {post.content}, {post.user_id}"
-    )
-    db.posts.update_post(post_id, post.title, post.content, post.user_id)
+async def update_post(post_id: int, post: Post, db: Database):
+    await db.posts.update_post(post_id, post.title, post.content, post.user_id)
     return {"message": "Post updated"}
 
 
 @router.delete("/{post_id}")
-def delete_post(post_id: int):
-    logging.info(f"Deleting post: {post_id}")
-    db.posts.delete_post(post_id)
+async def delete_post(post_id: int, db: Database):
+    await db.posts.delete_post(post_id)
     return {"message": "Post deleted"}
 
 
 @router.get("/user/{user_id}")
-def get_posts_by_user(user_id: int):
-    logging.info(f"Getting posts by user ID: {user_id}")
-    posts = db.posts.get_posts_by_user_id(user_id)
+async def get_posts_by_user(user_id: int, db: Database):
+    posts = await db.posts.get_posts_by_user_id(user_id)
     return {"posts": posts}
@@ -1,62 +1,52 @@
-import logging
+from fastapi import APIRouter, Response
 
-from fastapi import APIRouter
-from pydantic import BaseModel
-
-from db.core import DatabaseManager
+from routes.cache import TTLCache
+from routes.dependencies import Database
+from routes.responses import ORJSONResponse
+from routes.schemas import Product, ProductDetailOut, ProductListOut
 
 router = APIRouter(prefix="/products", tags=["products"])
 
-db = DatabaseManager.from_env()
-
-
-class Product(BaseModel):
-    name: str
-    description: str
-    price: float
-    quantity: int
+# Recently read products by ID; see TTLCache for the staleness bound
+product_cache = TTLCache()
 
 
-@router.get("/")
-def list_products():
-    products = db.products.get_all_products()
-    logging.info(f"Product Size: {len(products)}")
-    for product in products:
-        logging.info(f"Product: {product}")
+@router.get("/", response_model=ProductListOut)
+async def list_products(db: Database):
+    products = await db.products.get_all_products()
     return {"Products": products}
 
 
-@router.get("/{product_id}")
-def get_product(product_id: int):
-    logging.info(f"Getting product by ID: {product_id}")
-    product = db.products.get_product(product_id)
+@router.get("/{product_id}", response_model=ProductDetailOut)
+async def get_product(product_id: int, db: Database):
+    product = product_cache.get(product_id)
+    if product is None:
+        generation = product_cache.generation(product_id)
+        product = await db.products.get_product(product_id)
+        if product is not None:
+            product_cache.set(product_id, product, generation)
     return {"Product": product}
 
 
-@router.post("/")
-def create_product(product: Product):
-    logging.info(
-        f"Creating product: {product.name}, {product.description}, {product.price}, {product.quantity}"
-    )
-    db.products.create_product(
+@router.post("/", response_model=None)
+async def create_product(product: Product, db: Database):
+    await db.products.create_product(
         product.name, product.description, product.price, product.quantity
     )
-    return {"message": "Product created"}
+    return ORJSONResponse({"message": "Product created"})
 
 
-@router.put("/{product_id}")
-def update_product(product_id: int, product: Product):
-    logging.info(
-        f"Updating product: {product_id}, {product.name}, {product.description}, {product.price}, {product.quantity}"
-    )
-    db.products.update_product(
+@router.put("/{product_id}", status_code=204)
+async def update_product(product_id: int, product: Product, db: Database):
+    await db.products.update_product(
         product_id, product.name, product.description, product.price, product.quantity
     )
-    return {"message": "Product updated"}
+    product_cache.pop(product_id)
+    return Response(status_code=204)
 
 
-@router.delete("/{product_id}")
-def delete_product(product_id: int):
-    logging.info(f"Deleting product: {product_id}")
-    db.products.delete_product(product_id)
-    return {"message": "Product deleted"}
+@router.delete("/{product_id}", status_code=204)
+async def delete_product(product_id: int, db: Database):
+    await db.products.delete_product(product_id)
+    product_cache.pop(product_id)
+    return Response(status_code=204)
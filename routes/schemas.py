@@ -0,0 +1,59 @@
+"""
+Request and response models shared by the routers.
+
+Defined once at import so each model's pydantic-core validator and
+serializer are built a single time per process and reused by every request.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class User(BaseModel):
+    name: str
+    email: str
+    password: str = Field(min_length=8)
+
+
+class UserOut(BaseModel):
+    id: int
+    name: str
+    email: str
+
+
+class UserListOut(BaseModel):
+    users: List[UserOut]
+
+
+class UserDetailOut(BaseModel):
+    user: Optional[UserOut]
+
+
+class Product(BaseModel):
+    name: str
+    description: str
+    price: float
+    quantity: int
+
+
+class ProductOut(Product):
+    id: int
+
+
+class ProductListOut(BaseModel):
+    Products: List[ProductOut]
+
+
+class ProductDetailOut(BaseModel):
+    Product: Optional[ProductOut]
+
+
+class Post(BaseModel):
+    post_id: int = Field(gt=0)
+    title: str = Field(min_length=3, max_length=255)
+    content: str = Field(min_length=3, max_length=255)
+    user_id: int = Field(gt=0)
+    created_at: datetime = Field(default_factory=datetime.now, alias="createdAt")
+    updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
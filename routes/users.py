@@ -1,48 +1,76 @@
-import logging
+import hashlib
+from typing import Optional
 
-from fastapi import APIRouter
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Request, Response
 
-from db.core import DatabaseManager
+from routes.cache import TTLCache
+from routes.dependencies import Database
+from routes.responses import ORJSONResponse
+from routes.schemas import User, UserDetailOut, UserListOut
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Recently read users by ID; see TTLCache for the staleness bound
+user_cache = TTLCache()
+# The serialized user list with its ETag, under a single key
+user_list_cache = TTLCache(maxsize=1, ttl=5.0)
+USER_LIST_MAX_AGE = "max-age=5"
 
-db = DatabaseManager.from_env()
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header covers etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
 
-class User(BaseModel):
-    name: str
-    email: str
-    password: str = Field(min_length=8)
 
+@router.get("/", response_model=UserListOut)
+async def list_users(request: Request, db: Database):
+    cached = user_list_cache.get("users")
+    if cached is None:
+        generation = user_list_cache.generation("users")
+        users = await db.users.get_all_users()
+        # Serialized through the response model so passwords stay out
+        body = UserListOut(users=users).model_dump_json().encode()
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=8).hexdigest()
+        cached = (etag, body)
+        user_list_cache.set("users", cached, generation)
+    etag, body = cached
 
-@router.get("/")
-def list_users():
-    users = db.users.get_all_users()
-    logging.info(f"Users Size: {len(users)}")
-    for user in users:
-        logging.info(f"User: {user}")
-    return {"users": users}
+    headers = {"ETag": etag, "Cache-Control": USER_LIST_MAX_AGE}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
-@router.get("/{user_id}")
-def get_user(user_id: int):
-    logging.info(f"Getting user by ID: {user_id}")
-    user = db.users.get_user_by_id(user_id)
+@router.get("/{user_id}", response_model=UserDetailOut)
+async def get_user(user_id: int, db: Database):
+    user = user_cache.get(user_id)
+    if user is None:
+        generation = user_cache.generation(user_id)
+        user = await db.users.get_user_by_id(user_id)
+        if user is not None:
+            user_cache.set(user_id, user, generation)
     return {"user": user}
 
 
-@router.post("/")
-def create_user(user: User):
-    logging.info(f"Creating user: {user.name}, {user.email}")
-    db.users.create_user(user.name, user.email, user.password)
-    return {"message": "User created"}
+@router.post("/", response_model=None)
+async def create_user(user: User, db: Database):
+    await db.users.create_user(user.name, user.email, user.password)
+    user_list_cache.clear()
+    return ORJSONResponse({"message": "User created"})
 
 
-@router.put("/{user_id}")
-def update_user(user_id: int, user: User):
-    logging.info(f"Updating user: {user_id}, {user.name}, {user.email}")
+@router.put("/{user_id}", status_code=204)
+async def update_user(user_id: int, user: User, db: Database):
     data = {"name": user.name, "email": user.email, "password": user.password}
-    db.users.update_user(user_id, data)
-    return {"message": "User updated"}
+    await db.users.update_user(user_id, data)
+    user_cache.pop(user_id)
+    user_list_cache.clear()
+    return Response(status_code=204)
@@ -1,106 +1,84 @@
 import argparse
 import logging
 import sys
+from typing import TYPE_CHECKING
 
-from db.core import DatabaseManager
+if TYPE_CHECKING:
+    from db import DatabaseManager
 
 # Configure logging for this script
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
+log = logging.getLogger(__name__)
 
 
-def initialize_database(db_manager: DatabaseManager) -> bool:
+def initialize_database(db_manager: "DatabaseManager") -> bool:
     """Initialize the database and create tables with sample data."""
-    logging.info("Initializing database...")
+    log.info("Initializing database...")
     success = db_manager.initialize_database()
 
     if success:
-        logging.info("✅ Database initialization completed successfully.")
-        logging.info("📊 Sample users have been added to the database.")
+        log.info("✅ Database initialization completed successfully.")
+        log.info("📊 Sample users have been added to the database.")
     else:
-        logging.error("❌ Database initialization failed.")
+        log.error("❌ Database initialization failed.")
 
     return success
 
 
-def clean_and_reinitialize(db_manager: DatabaseManager, args) -> bool:
+def clean_and_reinitialize(db_manager: "DatabaseManager") -> bool:
     """Clean the existing database and reinitialize it."""
-    # Check if database exists and has data
-    users = db_manager.users.get_all_users()
-    products = db_manager.products.get_all_products()
-    if users:
-        if not args.force:
-            logging.warning(
-                f"🧹 Cleaning database with {len(users)} existing users - "
-                "this will delete all data!"
-            )
-        else:
-            logging.warning(f"🧹 Cleaning database with {len(users)} existing users")
-    if products:
-        if not args.force:
-            logging.warning(
-                f"🧹 Cleaning database with {len(products)} existing products - "
-                "this will delete all data!"
-            )
-        else:
-            logging.warning(
-                f"🧹 Cleaning database with {len(products)} existing products"
-            )
-    else:
-        logging.warning(
-            "🧹 No existing database found - proceeding with initialization."
-        )
-
-    # Ask for confirmation
+    # Report what is about to be deleted; --force was required to get here
     try:
-        if not args.force:
-            confirm = (
-                input("Are you sure you want to proceed? (yes/no): ").lower().strip()
-            )
-            if confirm not in ["yes", "y"]:
-                logging.info("Operation cancelled by user.")
-                return False
-    except KeyboardInterrupt:
-        logging.info("\nOperation cancelled by user.")
-        return False
+        user_count = db_manager.users.count()
+        product_count = db_manager.products.count()
+    except Exception:
+        # Counting fails when the database does not exist yet
+        user_count = product_count = 0
+    if user_count:
+        log.warning("🧹 Cleaning database with %d existing users", user_count)
+    if product_count:
+        log.warning("🧹 Cleaning database with %d existing products", product_count)
+    else:
+        log.warning("🧹 No existing database found - proceeding with initialization.")
 
     success = db_manager.clean_db()
 
     if success:
-        logging.info("✅ Database cleaned and reinitialized successfully.")
-        logging.info("📊 Fresh sample users have been loaded.")
-        logging.info("📊 Fresh sample products have been loaded.")
+        log.info("✅ Database cleaned and reinitialized successfully.")
+        log.info("📊 Fresh sample users have been loaded.")
+        log.info("📊 Fresh sample products have been loaded.")
     else:
-        logging.error("❌ Database cleaning failed.")
+        log.error("❌ Database cleaning failed.")
 
     return success
 
 
-def check_database_status(db_manager: DatabaseManager) -> None:
+def check_database_status(db_manager: "DatabaseManager") -> None:
     """Check the current status of the database."""
-    logging.info("🔍 Checking database status...")
+    log.info("🔍 Checking database status...")
 
     try:
-        users = db_manager.users.get_all_users()
-        products = db_manager.products.get_all_products()
-        if users:
-            logging.info(f"📈 Database is active with {len(users)} users:")
-            for user in users[:3]:  # Show first 3 users
-                logging.info(f"   - {user['name']} ({user['email']})")
-            if len(users) > 3:
-                logging.info(f"   ... and {len(users) - 3} more users")
-        if products:
-            logging.info(f"📈 Database is active with {len(products)} products:")
-            for product in products[:3]:  # Show first 3 products
-                logging.info(f"   - {product['name']} ({product['description']})")
-            if len(products) > 3:
-                logging.info(f"   ... and {len(products) - 3} more products")
+        user_count = db_manager.users.count()
+        product_count = db_manager.products.count()
+        if user_count:
+            log.info("📈 Database is active with %d users:", user_count)
+            for user in db_manager.users.get_preview(3):  # Show first 3 users
+                log.info("   - %s (%s)", user["name"], user["email"])
+            if user_count > 3:
+                log.info("   ... and %d more users", user_count - 3)
+        if product_count:
+            log.info("📈 Database is active with %d products:", product_count)
+            for product in db_manager.products.get_preview(3):  # Show first 3
+                log.info("   - %s (%s)", product["name"], product["description"])
+            if product_count > 3:
+                log.info("   ... and %d more products", product_count - 3)
         else:
-            logging.info("📭 Database is empty or not initialized.")
+            log.info("📭 Database is empty or not initialized.")
 
     except Exception as e:
-        logging.error(f"❌ Could not connect to database: {e}")
+        log.error("❌ Could not connect to database: %s", e)
 
 
 def main():
@@ -110,17 +88,17 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
     Examples:
-    uv run python init_db.py                    # Initialize database
-    uv run python init_db.py --clean            # Clean and reinitialize
-    uv run python init_db.py --status           # Check database status
-    uv run python init_db.py --clean --status   # Clean and show status
+    uv run python init_db.py                            # Initialize database
+    uv run python init_db.py --clean --force            # Clean and reinitialize
+    uv run python init_db.py --status                   # Check database status
+    uv run python init_db.py --clean --force --status   # Clean and show status
         """,
     )
 
     parser.add_argument(
         "--clean",
         action="store_true",
-        help="Clean and reinitialize the database (removes all data)",
+        help="Clean and reinitialize the database (removes all data, needs --force)",
     )
 
     parser.add_argument(
@@ -130,20 +108,29 @@ def main():
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Skip confirmation prompt and proceed with operation",
+        help="Confirm destructive operations such as --clean",
     )
 
     args = parser.parse_args()
+    # Fail fast rather than block on a prompt when run unattended
+    if args.clean and not args.force:
+        parser.error("refusing to wipe the database without --force")
+
+    # Imported only once the arguments are known to be valid, so --help and
+    # usage errors don't pay for loading the database drivers
+    from db import DatabaseManager
 
     try:
         # Initialize the database manager from environment variables
         db = DatabaseManager.from_env()
 
-        logging.info(f"🔗 Connecting to: {db.user}@{db.host}:{db.port}/{db.database}")
+        log.info(
+            "🔗 Connecting to: %s@%s:%s/%s", db.user, db.host, db.port, db.database
+        )
 
         # Perform requested operations
         if args.clean:
-            success = clean_and_reinitialize(db, args)
+            success = clean_and_reinitialize(db)
             if not success:
                 sys.exit(1)
         elif not args.status:
@@ -156,14 +143,14 @@ def main():
             check_database_status(db)
 
     except ValueError as e:
-        logging.error(f"❌ Configuration error: {e}")
-        logging.error("💡 Make sure your .env file is properly configured.")
+        log.error("❌ Configuration error: %s", e)
+        log.error("💡 Make sure your .env file is properly configured.")
         sys.exit(1)
     except KeyboardInterrupt:
-        logging.info("\n👋 Operation cancelled by user.")
+        log.info("\n👋 Operation cancelled by user.")
         sys.exit(0)
     except Exception as e:
-        logging.error(f"❌ Unexpected error: {e}")
+        log.error("❌ Unexpected error: %s", e)
         sys.exit(1)
 
 
@@ -1,31 +1,67 @@
 import logging
+import os
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
+from db import AsyncDatabaseManager
+from routes.middleware import AccessLogMiddleware, RequestIdFilter
 from routes.posts import router as posts_router
 from routes.product import router as products_router
 from routes.users import router as users_router
 
+# Handlers only enqueue records; log_listener formats and writes them from a
+# background thread, so request handlers never block on stream I/O.
+# WARNING by default so per-query debug/info logging stays off the hot path.
+log_queue = queue.SimpleQueue()
+log_output = logging.StreamHandler()
+log_output.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(request_id)s - %(message)s")
+)
+log_listener = QueueListener(log_queue, log_output)
+log_enqueue = QueueHandler(log_queue)
+log_enqueue.setFormatter(logging.Formatter("%(message)s"))  # Layout is log_output's
+log_enqueue.addFilter(RequestIdFilter())  # Runs in the request's context
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(), handlers=[log_enqueue]
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start log output and the shared database manager; undo both on exit"""
+    log_listener.start()
+    app.state.db = AsyncDatabaseManager.from_env()
+    try:
+        # Open the first min_pool_size connections now, so bad DB_* settings
+        # fail startup instead of the first requests
+        await app.state.db.get_pool()
+        yield
+    finally:
+        await app.state.db.close()
+        log_listener.stop()  # Flushes records still in the queue
+
+
 app = FastAPI(
     title="FastAPI DB Application",
     description="FastAPI application with MySQL database integration",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(AccessLogMiddleware)
 
 app.include_router(users_router)
 app.include_router(products_router)
 app.include_router(posts_router)
 
 
-@app.get("/")
-def read_root():
-    """Root endpoint providing API information and health status."""
-    return {
+# The root payload never changes, so it is serialized once at import
+ROOT_BODY = orjson.dumps(
+    {
         "message": "Welcome to FastAPI DB Application",
         "description": "FastAPI application with MySQL database integration",
         "version": "0.1.0",
@@ -40,7 +76,25 @@ def read_root():
             "redoc": "/redoc",
         },
     }
+)
+
+
+@app.get("/")
+async def read_root():
+    """Root endpoint providing API information and health status."""
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers need the app as an import string; each worker process
+    # builds its own pool of up to DB_POOL_SIZE connections. With
+    # uvicorn[standard] installed, "auto" selects uvloop and httptools.
+    uvicorn.run(
+        "src.server:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto",
+        log_level="warning",
+    )
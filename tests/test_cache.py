@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+
+from routes import product, users
+from routes.cache import TTLCache
+
+
+class StubProducts:
+    """Product table of one row whose SELECT waits until released"""
+
+    def __init__(self):
+        self.row = {
+            "id": 1,
+            "name": "old",
+            "description": "d",
+            "price": 1.0,
+            "quantity": 1,
+        }
+        self.select_started = asyncio.Event()
+        self.release_select = asyncio.Event()
+
+    async def get_product(self, product_id):
+        row = dict(self.row)  # Read before the update lands
+        self.select_started.set()
+        await self.release_select.wait()
+        return row
+
+    async def update_product(self, product_id, name, description, price, quantity):
+        self.row = {**self.row, "name": name}
+
+
+class StubUsers:
+    def __init__(self):
+        self.rows = [{"id": 1, "name": "old", "email": "old@example.com"}]
+        self.select_started = asyncio.Event()
+        self.release_select = asyncio.Event()
+
+    async def get_all_users(self):
+        rows = [dict(row) for row in self.rows]
+        self.select_started.set()
+        await self.release_select.wait()
+        return rows
+
+    async def create_user(self, name, email, password):
+        self.rows.append({"id": 2, "name": name, "email": email})
+
+
+class StubDatabase:
+    def __init__(self):
+        self.products = StubProducts()
+        self.users = StubUsers()
+
+
+class StubRequest:
+    headers = {}
+
+
+class TTLCacheGenerationTest(unittest.TestCase):
+    def test_set_is_dropped_after_pop(self):
+        cache = TTLCache()
+        generation = cache.generation(1)
+        cache.pop(1)
+        cache.set(1, "stale", generation)
+        self.assertIsNone(cache.get(1))
+
+    def test_set_is_dropped_after_clear(self):
+        cache = TTLCache()
+        generation = cache.generation(1)
+        cache.clear()
+        cache.set(1, "stale", generation)
+        self.assertIsNone(cache.get(1))
+
+    def test_pop_of_other_key_keeps_set(self):
+        cache = TTLCache()
+        generation = cache.generation(1)
+        cache.pop(2)
+        cache.set(1, "fresh", generation)
+        self.assertEqual(cache.get(1), "fresh")
+
+
+class ReadDuringUpdateTest(unittest.TestCase):
+    def setUp(self):
+        product.product_cache.clear()
+        users.user_list_cache.clear()
+
+    def test_get_product_does_not_recache_pre_update_row(self):
+        async def scenario():
+            db = StubDatabase()
+            read = asyncio.ensure_future(product.get_product(1, db))
+            await db.products.select_started.wait()
+            update = product.Product(name="new", description="d", price=1.0, quantity=1)
+            await product.update_product(1, update, db)
+            db.products.release_select.set()
+            await read
+
+        asyncio.run(scenario())
+        self.assertIsNone(product.product_cache.get(1))
+
+    def test_list_users_does_not_recache_pre_write_body(self):
+        async def scenario():
+            db = StubDatabase()
+            read = asyncio.ensure_future(users.list_users(StubRequest(), db))
+            await db.users.select_started.wait()
+            new_user = users.User(
+                name="new", email="new@example.com", password="password"
+            )
+            await users.create_user(new_user, db)
+            db.users.release_select.set()
+            await read
+
+        asyncio.run(scenario())
+        self.assertIsNone(users.user_list_cache.get("users"))
+
+
+if __name__ == "__main__":
+    unittest.main()